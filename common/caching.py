@@ -0,0 +1,65 @@
+from functools import lru_cache, partial
+
+_empty = object()
+
+
+class CachedProperty():
+    # Classes with a __dict__ keep the value under the property name, so
+    # later reads never reach the descriptor. Classes with __slots__ must
+    # declare a slot named by CachedProperty.slot(name) to hold it;
+    # invalidating stores a marker there rather than deleting the slot, so
+    # it never raises, cached or not.
+    def __init__(self, func, name=None):
+        self.func = func
+        self.name = name if name is not None else func.__name__
+        self.slot_name = self.slot(self.name)
+        self.__doc__ = func.__doc__
+
+    @staticmethod
+    def slot(name: str) -> str:
+        return '_cached_' + name
+
+    def __get__(self, instance, class_):
+        if instance is None:
+            return self
+        if type(instance).__dictoffset__:
+            res = self.func(instance)
+            instance.__dict__[self.name] = res
+            return res
+        res = getattr(instance, self.slot_name, _empty)
+        if res is _empty:
+            res = self.func(instance)
+            setattr(instance, self.slot_name, res)
+        return res
+
+    def invalidate(self, instance):
+        if type(instance).__dictoffset__:
+            instance.__dict__.pop(self.name, None)
+        else:
+            setattr(instance, self.slot_name, _empty)
+
+
+def invalidate(instance, *names: str):
+    for name in names:
+        descriptor = getattr(type(instance), name)
+        if not isinstance(descriptor, CachedProperty):
+            raise TypeError("`{}` is not a CachedProperty".format(name))
+        descriptor.invalidate(instance)
+
+
+def cache_stats(cached) -> dict:
+    info = cached.cache_info()
+    calls = info.hits + info.misses
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize,
+            'hit_rate': info.hits / calls if calls else 0.0}
+
+
+def memoize(maxsize: int | None = 128):
+    # Bounded LRU memoisation that keeps hit and miss counters. The result is
+    # functools' own wrapper, so a hit adds no Python-level call; `stats()`
+    # reports the counters and `cache_clear()` empties it.
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+        cached.stats = partial(cache_stats, cached)
+        return cached
+    return decorator
@@ -0,0 +1,94 @@
+import copy
+import hashlib
+import json
+import os
+from typing import Callable
+
+chunk_size = 1 << 20
+
+
+class Checkpoint():
+    def __init__(self, offset: int, digest: str, state: dict):
+        self.offset = offset
+        self.digest = digest
+        self.state = state
+
+    def __repr__(self):
+        return f'Checkpoint(offset: {self.offset}, digest: {self.digest[:12]})'
+
+    @classmethod
+    def load(cls, path: str):
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+            return cls(saved['offset'], saved['digest'], saved['state'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, path: str):
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump({'offset': self.offset, 'digest': self.digest, 'state': self.state}, f)
+        os.replace(temporary, path)
+
+
+def checkpoint_path(path: str) -> str:
+    return path + '.checkpoint.json'
+
+
+def hash_prefix(f, length: int):
+    # Hashing is far cheaper than parsing, so the whole consumed prefix is
+    # checked: any rewrite before the offset forces a recompute.
+    hasher = hashlib.sha256()
+    f.seek(0)
+    remaining = length
+    while remaining > 0:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        hasher.update(chunk)
+        remaining -= len(chunk)
+    return hasher, remaining == 0
+
+
+def update(path: str, new_state: Callable[[], dict], consume: Callable[[dict, bytes], None],
+           checkpoint_file: str | None = None) -> tuple[dict, dict | None]:
+    # Only newline-terminated lines are committed to the checkpoint and to
+    # the returned state. A last line without a newline may still be
+    # growing, so it is only applied to a copy, returned as the provisional
+    # state (None when there is no such line or it does not parse).
+    checkpoint_file = checkpoint_file if checkpoint_file is not None else checkpoint_path(path)
+    checkpoint = Checkpoint.load(checkpoint_file)
+    with open(path, 'rb', buffering=chunk_size) as f:
+        hasher = None
+        if checkpoint is not None and checkpoint.state.keys() == new_state().keys():
+            hasher, complete = hash_prefix(f, checkpoint.offset)
+            if not complete or hasher.hexdigest() != checkpoint.digest:
+                hasher = None
+        if hasher is None:
+            # First run, truncated or rewritten file, or a checkpoint from an
+            # older state layout: recompute from scratch.
+            hasher = hashlib.sha256()
+            checkpoint = Checkpoint(0, hasher.hexdigest(), new_state())
+
+        state = checkpoint.state
+        offset = checkpoint.offset
+        tail = None
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                tail = line
+                break
+            consume(state, line)
+            hasher.update(line)
+            offset += len(line)
+
+    Checkpoint(offset, hasher.hexdigest(), state).save(checkpoint_file)
+    provisional = None
+    if tail:
+        provisional = copy.deepcopy(state)
+        try:
+            consume(provisional, tail)
+        except (ValueError, TypeError, IndexError, KeyError, AttributeError):
+            provisional = None
+    return state, provisional
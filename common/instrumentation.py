@@ -0,0 +1,131 @@
+import cProfile
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class StageRecord():
+    def __init__(self, name: str):
+        self.__name = name
+        self.__counters = {}
+        self.seconds = 0.0
+        self.peak_bytes = None
+
+    def __repr__(self):
+        counters = ', '.join(f'{k}: {v}' for k, v in self.__counters.items())
+        memory = '' if self.peak_bytes is None else f', peak {self.peak_bytes / 2**20:.1f} MiB'
+        return f'{self.__name}: {self.seconds:.4f} s{memory}' + (f' ({counters})' if counters else '')
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def counters(self) -> dict[str, int]:
+        return self.__counters
+
+    def count(self, counter: str, value: int = 1):
+        self.__counters[counter] = self.__counters.get(counter, 0) + value
+
+    @property
+    def rates(self) -> dict[str, float]:
+        if self.seconds <= 0:
+            return {}
+        return {f'{k}/s': v / self.seconds for k, v in self.__counters.items()}
+
+    def as_dict(self) -> dict:
+        return {'stage': self.__name, 'seconds': self.seconds, 'peak_bytes': self.peak_bytes,
+                'counters': dict(self.__counters), 'rates': self.rates}
+
+
+class NullRecord():
+    def count(self, counter: str, value: int = 1):
+        pass
+
+
+class NullStage():
+    # Shared context manager returned while instrumentation is disabled.
+    record = NullRecord()
+
+    def __enter__(self):
+        return self.record
+
+    def __exit__(self, *exc):
+        return False
+
+
+class Instrumentation():
+    def __init__(self, trace_memory: bool = True):
+        self.__trace_memory = trace_memory
+        self.__records = []
+
+    @property
+    def records(self) -> list[StageRecord]:
+        return self.__records
+
+    @contextmanager
+    def stage(self, name: str):
+        record = StageRecord(name)
+        tracing = self.__trace_memory and not tracemalloc.is_tracing()
+        if self.__trace_memory:
+            if tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if self.__trace_memory:
+                record.peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+                if tracing:
+                    tracemalloc.stop()
+            self.__records.append(record)
+
+    def report(self) -> str:
+        lines = []
+        for record in self.__records:
+            lines.append(repr(record))
+            lines += [f'    {k:<16} {v:>14,.0f}' for k, v in record.rates.items()]
+        return '\n'.join(lines)
+
+    def as_dict(self) -> list[dict]:
+        return [r.as_dict() for r in self.__records]
+
+
+_null_stage = NullStage()
+_active = None
+
+
+def enable(trace_memory: bool = True) -> Instrumentation:
+    global _active
+    _active = Instrumentation(trace_memory=trace_memory)
+    return _active
+
+
+def disable() -> Instrumentation | None:
+    global _active
+    instrumentation, _active = _active, None
+    return instrumentation
+
+
+def active() -> Instrumentation | None:
+    return _active
+
+
+def stage(name: str):
+    # The only cost while disabled is this check, once per stage.
+    if _active is None:
+        return _null_stage
+    return _active.stage(name)
+
+
+def profile(function, *args, output: str | None = None, sort: str = 'cumulative', limit: int = 25):
+    profiler = cProfile.Profile()
+    result = profiler.runcall(function, *args)
+    if output is not None:
+        profiler.dump_stats(output)
+    pstats.Stats(profiler).strip_dirs().sort_stats(sort).print_stats(limit)
+    return result
@@ -0,0 +1,24 @@
+import mmap
+from typing import Iterator
+
+buffer_size = 1 << 20
+
+
+def iter_lines(path: str, use_mmap: bool = True) -> Iterator[bytes]:
+    # Lines come back as bytes without the newline and are never decoded, so
+    # the callers run bytes patterns on them directly. With mmap the page
+    # cache is read in place and only each line is copied out.
+    with open(path, 'rb', buffering=buffer_size) as f:
+        if use_mmap:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and non-regular files cannot be mapped.
+                data = None
+            if data is not None:
+                with data:
+                    for line in iter(data.readline, b''):
+                        yield line.rstrip(b'\n')
+                return
+        for line in f:
+            yield line.rstrip(b'\n')
@@ -1,18 +1,10 @@
 import re
 from os.path import join
 
-class CachedProperty():
-    def __init__(self, func, name=None):
-        self.func = func
-        self.name = name if name is not None else func.__name__
-        self.__doc__ = func.__doc__
-
-    def __get__(self, instance, class_):
-        if instance is None:
-            return self
-        res = self.func(instance)
-        setattr(instance, self.name, res)
-        return res
+from common.caching import CachedProperty
+from common.lines import iter_lines
+from common.instrumentation import stage
+from day_1.parallel import parallel_sum
 
 
 class CalibrationValue():
@@ -46,14 +38,55 @@ class CalibrationValue():
 
 folder_name = 'day_1'
 
+
+digit_pattern = re.compile(r'\d')
+digit_bytes_pattern = re.compile(rb'\d')
+
+
+def calibrate(line: str) -> int:
+    matches = digit_pattern.findall(line)
+    return 10 * int(matches[0]) + int(matches[-1])
+
+
+def calibrate_bytes(line: bytes) -> int:
+    matches = digit_bytes_pattern.findall(line)
+    return 10 * int(matches[0]) + int(matches[-1])
+
+
+def iter_calibration(file_name: str, use_mmap: bool = True):
+    for line in iter_lines(join(folder_name, file_name), use_mmap=use_mmap):
+        yield calibrate_bytes(line)
+
+
+def sum_calibration(file_name: str, workers: int = 1) -> int:
+    if workers > 1:
+        return parallel_sum(calibrate, join(folder_name, file_name), workers)
+    return sum(iter_calibration(file_name))
+
+
+def parse(data: bytes) -> list[bytes]:
+    with stage('day_1.event_1.parse') as record:
+        lines = data.splitlines()
+        record.count('lines', len(lines))
+    return lines
+
+
+def solve(lines: list[bytes]) -> int:
+    with stage('day_1.event_1.solve') as record:
+        total = sum(calibrate_bytes(line) for line in lines)
+        record.count('lines', len(lines))
+    return total
+
+
 def get_number_list(file_name: str, verbose:str=False):
+    if not verbose:
+        return list(iter_calibration(file_name))
     numbers = []
     with open(join(folder_name, file_name)) as f:
         for line in f:
             value = CalibrationValue(line)
             numbers.append(value.process_string())
-            if verbose:
-                print('{:<47} -> {:>2}'.format(value.cleaned, numbers[-1]))
+            print('{:<47} -> {:>2}'.format(value.cleaned, numbers[-1]))
     return numbers
 
 if __name__ == '__main__':
@@ -63,5 +96,4 @@ if __name__ == '__main__':
     print("And the sum is {}".format(sum(l)))
 
     print("Now reading and processing the full file. . .")
-    l = get_number_list('input_1.txt', verbose=False)
-    print("And obtaining the sum {}".format(sum(l)))
\ No newline at end of file
+    print("And obtaining the sum {}".format(sum_calibration('input_1.txt')))
\ No newline at end of file
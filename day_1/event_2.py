@@ -1,6 +1,11 @@
 import re
 from os.path import join
 
+from common.caching import CachedProperty
+from common.lines import iter_lines
+from common.instrumentation import stage
+from day_1.parallel import parallel_sum
+
 _mapped_values = {
     'one': '1', 
     'two': '2', 
@@ -14,23 +19,36 @@ _mapped_values = {
     }
 
 
-class CachedProperty():
-    def __init__(self, func, name=None):
-        self.func = func
-        self.name = name if name is not None else func.__name__
-        self.__doc__ = func.__doc__
+class DigitScanner():
+    # Both searches run in the regex engine. The last digit is the first
+    # match of the reversed words in the reversed string: no digit word
+    # contains another, so the word that starts last also ends last.
+    # Works on str, or on bytes when built from bytes words.
+    def __init__(self, words: dict[str, str] | dict[bytes, str]):
+        separator = '|' if isinstance(next(iter(words)), str) else b'|'
+        self.__values = dict(words)
+        self.__reversed_values = {word[::-1]: digit for word, digit in words.items()}
+        self.__first = re.compile(separator.join(map(re.escape, words)))
+        self.__last = re.compile(separator.join(map(re.escape, self.__reversed_values)))
+
+    def first(self, string: str, stop: int | None = None) -> str | None:
+        # Only words that end by `stop` are considered.
+        found = self.__first.search(string, 0, len(string) if stop is None else stop)
+        return None if found is None else self.__values[found.group()]
+
+    def last(self, string: str, start_at: int = 0) -> str | None:
+        # Only words that start at or after `start_at` are considered.
+        found = self.__last.search(string[::-1], 0, len(string) - start_at)
+        return None if found is None else self.__reversed_values[found.group()]
 
-    def __get__(self, instance, class_):
-        if instance is None:
-            return self
-        res = self.func(instance)
-        setattr(instance, self.name, res)
-        return res
+
+_digit_words = {**_mapped_values, **{d: d for d in '0123456789'}}
+_scanner = DigitScanner(_digit_words)
+_byte_scanner = DigitScanner({word.encode(): digit for word, digit in _digit_words.items()})
 
 
 class CalibrationValue():
     __digit_pattern = re.compile('\d')
-    __letter_digit_pattern = re.compile('(?=(one|two|three|four|five|six|seven|eight|nine))')
 
     def __init__(self, string: str):
         self.__original_string = string
@@ -39,24 +57,15 @@ class CalibrationValue():
     def pattern(self):
         return self.__digit_pattern
 
-    @staticmethod
-    def digit_replace(match_object):
-        numdict = {'one':'1','two':'2','three':'3','four':'4','five':'5','six':'6','seven':'7','eight':'8','nine':'9','zero':'0'}
-        return numdict[match_object.group(1)]
-
     @CachedProperty
     def cleaned(self):
         return self.__original_string.strip('\n')
 
-    @CachedProperty
-    def digitalized(self):
-        return re.sub(self.__letter_digit_pattern, self.digit_replace, self.cleaned)
-
     def __two_digits(self) -> tuple[str, str]:
-        matches = self.__digit_pattern.findall(self.digitalized)
-        if len(matches) == 0:
+        first = _scanner.first(self.__original_string)
+        if first is None:
             return ()
-        return matches[0], matches[-1]
+        return first, _scanner.last(self.__original_string)
 
     def __combine_digits(self, first: str, last: str) -> int:
         return int('{}{}'.format(first, last))
@@ -68,14 +77,49 @@ class CalibrationValue():
 
 folder_name = 'day_1'
 
+
+def calibrate(line: str) -> int:
+    return 10 * int(_scanner.first(line)) + int(_scanner.last(line))
+
+
+def calibrate_bytes(line: bytes) -> int:
+    return 10 * int(_byte_scanner.first(line)) + int(_byte_scanner.last(line))
+
+
+def iter_calibration(file_name: str, use_mmap: bool = True):
+    for line in iter_lines(join(folder_name, file_name), use_mmap=use_mmap):
+        yield calibrate_bytes(line)
+
+
+def sum_calibration(file_name: str, workers: int = 1) -> int:
+    if workers > 1:
+        return parallel_sum(calibrate, join(folder_name, file_name), workers)
+    return sum(iter_calibration(file_name))
+
+
+def parse(data: bytes) -> list[bytes]:
+    with stage('day_1.event_2.parse') as record:
+        lines = data.splitlines()
+        record.count('lines', len(lines))
+    return lines
+
+
+def solve(lines: list[bytes]) -> int:
+    with stage('day_1.event_2.solve') as record:
+        total = sum(calibrate_bytes(line) for line in lines)
+        record.count('lines', len(lines))
+    return total
+
+
 def get_number_list(file_name: str, verbose:str=False):
+    if not verbose:
+        return list(iter_calibration(file_name))
     numbers = []
     with open(join(folder_name, file_name)) as f:
         for line in f:
             value = CalibrationValue(line)
             numbers.append(value.process_string())
-            if verbose:
-                print('{:<47} -> {:>2}'.format(value.cleaned, numbers[-1]))
+            print('{:<47} -> {:>2}'.format(value.cleaned, numbers[-1]))
     return numbers
 
 if __name__ == '__main__':
@@ -85,5 +129,4 @@ if __name__ == '__main__':
     print("And the sum is {}".format(sum(l)))
 
     print("Now reading and processing the full file. . .")
-    l = get_number_list('input_1.txt', verbose=False)
-    print("And obtaining the sum {}".format(sum(l)))
\ No newline at end of file
+    print("And obtaining the sum {}".format(sum_calibration('input_1.txt')))
\ No newline at end of file
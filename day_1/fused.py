@@ -0,0 +1,57 @@
+import re
+import sys
+from os.path import join
+
+from common.instrumentation import stage
+from day_1.event_2 import _mapped_values
+
+folder_name = 'day_1'
+buffer_size = 1 << 20
+
+digit_pattern = re.compile(r'\d')
+word_pattern = re.compile('|'.join(_mapped_values))
+reversed_word_pattern = re.compile('|'.join(word[::-1] for word in _mapped_values))
+_reversed_values = {word[::-1]: digit for word, digit in _mapped_values.items()}
+
+
+def calibrate_both(line: str) -> tuple[int, int]:
+    # Both parts share one reversed copy of the line and the numeric digit
+    # searches. A spelled digit can only come first if it ends before the
+    # first numeric digit, and last if it starts after the last one, so the
+    # word searches are bounded by those positions.
+    reverse = line[::-1]
+    first = digit_pattern.search(line)
+    if first is None:
+        # Only spelled digits: part 1 has nothing to add, and part 2 scans
+        # the whole line.
+        first_2 = _mapped_values[word_pattern.search(line).group()]
+        last_2 = _reversed_values[reversed_word_pattern.search(reverse).group()]
+        return 0, 10 * int(first_2) + int(last_2)
+    last = digit_pattern.search(reverse)
+    first_1, last_1 = first.group(), last.group()
+    word = word_pattern.search(line, 0, first.start())
+    first_2 = _mapped_values[word.group()] if word else first_1
+    word = reversed_word_pattern.search(reverse, 0, last.start())
+    last_2 = _reversed_values[word.group()] if word else last_1
+    return 10 * int(first_1) + int(last_1), 10 * int(first_2) + int(last_2)
+
+
+def sum_both(file_name: str) -> tuple[int, int]:
+    part_1 = part_2 = 0
+    with stage('day_1.fused.solve') as record:
+        with open(join(folder_name, file_name), buffering=buffer_size) as f:
+            lines = 0
+            for line in f:
+                value_1, value_2 = calibrate_both(line)
+                part_1 += value_1
+                part_2 += value_2
+                lines += 1
+        record.count('lines', lines)
+    return part_1, part_2
+
+
+if __name__ == '__main__':
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'input_1.txt'
+    part_1, part_2 = sum_both(file_name)
+    print("Part 1: {}".format(part_1))
+    print("Part 2: {}".format(part_2))
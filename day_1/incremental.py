@@ -0,0 +1,35 @@
+import sys
+from os.path import join
+
+from common.incremental import update
+from day_1.fused import calibrate_both
+
+folder_name = 'day_1'
+
+
+def new_state() -> dict:
+    return {'lines': 0, 'part_1': 0, 'part_2': 0}
+
+
+def consume(state: dict, line: bytes):
+    value_1, value_2 = calibrate_both(line.decode())
+    state['lines'] += 1
+    state['part_1'] += value_1
+    state['part_2'] += value_2
+
+
+def sum_calibration(file_name: str, checkpoint_file: str | None = None,
+                    provisional: bool = False) -> tuple[int, int]:
+    # With `provisional`, an unterminated last line is counted when it
+    # parses; otherwise only newline-terminated lines are.
+    state, with_tail = update(join(folder_name, file_name), new_state, consume, checkpoint_file=checkpoint_file)
+    if provisional and with_tail is not None:
+        state = with_tail
+    return state['part_1'], state['part_2']
+
+
+if __name__ == '__main__':
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'input_1.txt'
+    part_1, part_2 = sum_calibration(file_name, provisional=True)
+    print("Part 1: {}".format(part_1))
+    print("Part 2: {}".format(part_2))
@@ -0,0 +1,47 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterator
+
+buffer_size = 1 << 20
+
+
+def newline_ranges(path: str, parts: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for k in range(1, parts):
+            target = max(size * k // parts, bounds[-1])
+            if target == 0:
+                continue
+            # Read from one byte early so a target that already sits at the
+            # start of a line is kept as the boundary.
+            f.seek(target - 1)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(b, e) for b, e in zip(bounds, bounds[1:]) if e > b]
+
+
+def iter_range(path: str, start: int, end: int) -> Iterator[str]:
+    with open(path, 'rb', buffering=buffer_size) as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode()
+
+
+def sum_range(calibrate: Callable[[str], int], path: str, start: int, end: int) -> int:
+    return sum(calibrate(line) for line in iter_range(path, start, end))
+
+
+def parallel_sum(calibrate: Callable[[str], int], path: str, workers: int) -> int:
+    ranges = newline_ranges(path, workers)
+    starts = [b for b, _ in ranges]
+    ends = [e for _, e in ranges]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(partial(sum_range, calibrate, path), starts, ends))
@@ -0,0 +1,84 @@
+import os
+import sys
+import numpy as np
+from os.path import join
+
+from common.instrumentation import stage
+
+folder_name = 'day_1'
+block_size = 1 << 26
+
+newline = ord('\n')
+zero, nine = ord('0'), ord('9')
+
+
+def sum_buffer(buffer: np.ndarray) -> int:
+    # Digit positions are sorted, so the digits of one line are contiguous
+    # and each line's first and last digits sit where the line index of the
+    # digits changes. Lines without digits simply have no segment.
+    digits = np.flatnonzero((buffer >= zero) & (buffer <= nine))
+    if not digits.size:
+        return 0
+    lines = np.searchsorted(np.flatnonzero(buffer == newline), digits)
+    ends = np.flatnonzero(lines[1:] != lines[:-1])
+    firsts = buffer[digits[np.append(0, ends + 1)]].astype(np.int64) - zero
+    lasts = buffer[digits[np.append(ends, digits.size - 1)]].astype(np.int64) - zero
+    return int(10 * firsts.sum() + lasts.sum())
+
+
+def line_end(data: np.ndarray, start: int, size: int = block_size) -> int:
+    # Just past the first newline at or after `start`, looking one block at
+    # a time so a very long line never makes a mask of the rest of the file.
+    while start < data.size:
+        found = np.flatnonzero(data[start:start + size] == newline)
+        if found.size:
+            return start + int(found[0]) + 1
+        start += size
+    return data.size
+
+
+def iter_blocks(path: str, size: int = block_size):
+    # The file is mapped and cut into blocks that end on a newline, so
+    # memory stays bounded by the block size rather than the input size.
+    if os.path.getsize(path) == 0:
+        return
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    start = 0
+    while start < data.size:
+        end = min(start + size, data.size)
+        if end < data.size:
+            cuts = np.flatnonzero(data[start:end] == newline)
+            if cuts.size:
+                end = start + int(cuts[-1]) + 1
+            else:
+                end = line_end(data, end, size)
+        yield data[start:end]
+        start = end
+
+
+def sum_calibration(file_name: str, size: int = block_size) -> int:
+    with stage('day_1.vectorised.solve') as record:
+        total = 0
+        blocks = 0
+        for block in iter_blocks(join(folder_name, file_name), size):
+            total += sum_buffer(block)
+            blocks += 1
+        record.count('blocks', blocks)
+    return total
+
+
+def parse(data: bytes) -> np.ndarray:
+    with stage('day_1.vectorised.parse') as record:
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        record.count('bytes', buffer.size)
+    return buffer
+
+
+def solve(buffer: np.ndarray) -> int:
+    with stage('day_1.vectorised.solve'):
+        return sum_buffer(buffer)
+
+
+if __name__ == '__main__':
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'input_1.txt'
+    print("And obtaining the sum {}".format(sum_calibration(file_name)))
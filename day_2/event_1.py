@@ -1,6 +1,10 @@
 import re
 from os.path import join
 
+from common.instrumentation import stage
+from common.lines import iter_lines
+from day_2.tokenizer import parse_draw, parse_draws, split_game
+
 
 folder_name = 'day_2'
 digit_pattern = re.compile('\d+')
@@ -10,11 +14,21 @@ max_values = {'red': 12, 'blue': 14, 'green': 13}
 
 
 class Extraction():
+    __slots__ = ('__red', '__blue', '__green')
 
     def __init__(self, red: int = 0, blue: int = 0, green: int = 0):
-        self.__red = red
-        self.__blue = blue
-        self.__green = green
+        self.red = red
+        self.blue = blue
+        self.green = green
+
+    @classmethod
+    def trusted(cls, red: int = 0, blue: int = 0, green: int = 0):
+        # Skips the setters: only for counts the parser already knows are valid.
+        extraction = cls.__new__(cls)
+        extraction.__red = red
+        extraction.__blue = blue
+        extraction.__green = green
+        return extraction
     
     def __repr__(self):
         return f'Extraction(red: {self.red}, green: {self.green}, blue: {self.blue})'
@@ -61,30 +75,47 @@ class Extraction():
             return self.blue
         raise KeyError("`color` should be one of [red, green, blue]")
 
-    @property
-    def possible(self):
-        if self.red > max_values['red']:
+    def is_possible(self, limits: dict[str, int] = max_values) -> bool:
+        if self.red > limits['red']:
             return False
-        if self.green > max_values['green']:
+        if self.green > limits['green']:
             return False
-        if self.blue > max_values['blue']:
+        if self.blue > limits['blue']:
             return False
         return True
 
+    @property
+    def possible(self):
+        return self.is_possible(max_values)
+
     @classmethod
     def parse_cubeset(cls, string):
         matches = number_color_pattern.findall(string)
         dic = {c: int(n) for n, c in matches}
-        return cls(**dic)
+        return cls.trusted(**dic)
+
+
+def extractions_of(body: bytes) -> list[Extraction]:
+    return [Extraction.trusted(red=red, green=green, blue=blue) for red, green, blue in parse_draws(body)]
 
 
 class Game():
     def __init__(self, game_number : int = 0, extractions: list[Extraction] = []):
         self.__game_number = game_number
         self.__extractions = extractions
+        self.__body = None
+
+    @classmethod
+    def lazy(cls, line: bytes):
+        # Only the game number is read: the draws stay in the raw line until
+        # `extractions` needs them.
+        game_number, body = split_game(line)
+        game = cls(game_number=game_number, extractions=None)
+        game.__body = body
+        return game
     
     def __repr__(self):
-        extractions = '\n'.join([f' -> {repr(e)}' for e in self.__extractions])
+        extractions = '\n'.join([f' -> {repr(e)}' for e in self.extractions])
         return f'Game {self.__game_number}:\n' + extractions
         
     @property
@@ -97,6 +128,13 @@ class Game():
             self.__game_number = value
         else:
             raise ValueError("game number should be >= 0")
+
+    @property
+    def extractions(self) -> list[Extraction]:
+        if self.__extractions is None:
+            self.__extractions = extractions_of(self.__body)
+            self.__body = None
+        return self.__extractions
     
     @classmethod
     def extract_game(cls, game_string: str):
@@ -104,37 +142,67 @@ class Game():
         game_number = int(digit_pattern.findall(game_number)[0])
         extractions = [Extraction.parse_cubeset(e) for e in extractions.split(';')]
         return cls(game_number=game_number, extractions=extractions)
+
+    @classmethod
+    def extract_game_bytes(cls, line: bytes):
+        game_number, body = split_game(line)
+        return cls(game_number=game_number, extractions=extractions_of(body))
     
-    def check_game(self):
+    def check_game(self, limits: dict[str, int] = max_values):
+        if self.__extractions is None:
+            # A lazy game is rejected at the first draw over the limits,
+            # without building any Extraction.
+            max_red, max_green, max_blue = limits['red'], limits['green'], limits['blue']
+            for draw in self.__body.split(b';'):
+                red, green, blue = parse_draw(draw)
+                if red > max_red or green > max_green or blue > max_blue:
+                    return False
+            return True
         for e in self.__extractions:
-            if not e.possible:
+            if not e.is_possible(limits):
                 return False
         return True
 
 
-def parse_file(file_name: str, verbose:str=False) -> list[Game]:
+def parse_file(file_name: str, verbose:str=False, use_mmap: bool = True, lazy: bool = False) -> list[Game]:
     games = []
-    with open(join(folder_name, file_name)) as f:
-        for line in f:
-            line = line.strip('\n')
-            g = Game.extract_game(line)
-            games.append(g)
-            if verbose:
-                print(g)
+    build = Game.lazy if lazy else Game.extract_game_bytes
+    for line in iter_lines(join(folder_name, file_name), use_mmap=use_mmap):
+        g = build(line)
+        games.append(g)
+        if verbose:
+            print(g)
     return games
 
 
-def find_possible_games(games: list[Game], verbose=False) -> list[int]:
+def find_possible_games(games: list[Game], verbose=False, limits: dict[str, int] = max_values) -> list[int]:
+    if not verbose:
+        return [g.game_number for g in games if g.check_game(limits)]
     possible_games = []
     for g in games:
-        possible = g.check_game()
+        possible = g.check_game(limits)
         if possible:
             possible_games.append(g.game_number)
-        if verbose:
-            print("Game {} is {}".format(g.game_number, 'possible' if possible else 'not possible'))
+        print("Game {} is {}".format(g.game_number, 'possible' if possible else 'not possible'))
     return possible_games
 
 
+def parse(data: bytes) -> list[Game]:
+    with stage('day_2.event_1.parse') as record:
+        # Part 1 only asks whether each game fits, which a lazy game answers
+        # straight from its raw line.
+        games = [Game.lazy(line) for line in data.splitlines()]
+        record.count('lines', len(games))
+    return games
+
+
+def solve(games: list[Game]) -> int:
+    with stage('day_2.event_1.solve') as record:
+        possible_games = find_possible_games(games)
+        record.count('games', len(games))
+        record.count('possible games', len(possible_games))
+    return sum(possible_games)
+
 
 if __name__ == '__main__':
     games = parse_file('input_1_example.txt', verbose=True)
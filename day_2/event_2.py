@@ -1,6 +1,11 @@
 import re
 from os.path import join
 
+from common.caching import CachedProperty, invalidate
+from common.instrumentation import stage
+from common.lines import iter_lines
+from day_2.tokenizer import parse_draw, parse_draws, split_game
+
 
 folder_name = 'day_2'
 digit_pattern = re.compile('\d+')
@@ -9,25 +14,30 @@ number_color_pattern = re.compile('(\d+\s(?=(red|blue|green)))')
 max_values = {'red': 12, 'blue': 14, 'green': 13}
 
 
-class CachedProperty():
-    def __init__(self, func, name=None):
-        self.func = func
-        self.name = name if name is not None else func.__name__
-        self.__doc__ = func.__doc__
-
-    def __get__(self, instance, class_):
-        if instance is None:
-            return self
-        res = self.func(instance)
-        setattr(instance, self.name, res)
-        return res
-
-
 class CubeSet():
+    __slots__ = ('__red', '__blue', '__green', CachedProperty.slot('power'))
+
     def __init__(self, red: int = 0, blue: int = 0, green: int = 0):
+        # Validates like the setters, but a new set has no cached power to
+        # invalidate, so the slots are filled directly.
+        if red < 0:
+            raise ValueError("Red balls should be >= 0")
+        if blue < 0:
+            raise ValueError("Blue balls should be >= 0")
+        if green < 0:
+            raise ValueError("Green balls should be >= 0")
         self.__red = red
         self.__blue = blue
         self.__green = green
+
+    @classmethod
+    def trusted(cls, red: int = 0, blue: int = 0, green: int = 0):
+        # Skips the setters: only for counts the parser already knows are valid.
+        cube_set = cls.__new__(cls)
+        cube_set.__red = red
+        cube_set.__blue = blue
+        cube_set.__green = green
+        return cube_set
     
     def __repr__(self):
         return f'Cube Set(red: {self.red}, green: {self.green}, blue: {self.blue})'
@@ -36,7 +46,7 @@ class CubeSet():
     def parse_cubeset(cls, string):
         matches = number_color_pattern.findall(string)
         dic = {c: int(n) for n, c in matches}
-        return cls(**dic)
+        return cls.trusted(**dic)
 
     @property
     def red(self):
@@ -46,6 +56,7 @@ class CubeSet():
     def red(self, value: int):
         if value >= 0:
             self.__red = value
+            invalidate(self, 'power')
         else:
             raise ValueError("Red balls should be >= 0")
 
@@ -57,6 +68,7 @@ class CubeSet():
     def green(self, value: int):
         if value >= 0:
             self.__green = value
+            invalidate(self, 'power')
         else:
             raise ValueError("Green balls should be >= 0")
     
@@ -68,6 +80,7 @@ class CubeSet():
     def blue(self, value: int):
         if value >= 0:
             self.__blue = value
+            invalidate(self, 'power')
         else:
             raise ValueError("Blue balls should be >= 0")
 
@@ -82,24 +95,41 @@ class CubeSet():
 
     @CachedProperty
     def power(self) -> int:
-        return self.red * self.blue * self.green
+        return self.__red * self.__blue * self.__green
 
-    @CachedProperty
-    def possible(self) -> bool:
-        if self.red > max_values['red']:
+    def is_possible(self, limits: dict[str, int] = max_values) -> bool:
+        if self.red > limits['red']:
             return False
-        if self.green > max_values['green']:
+        if self.green > limits['green']:
             return False
-        if self.blue > max_values['blue']:
+        if self.blue > limits['blue']:
             return False
         return True
 
+    @property
+    def possible(self) -> bool:
+        return self.is_possible(max_values)
+
     
 
+def cube_sets(body: bytes) -> list[CubeSet]:
+    return [CubeSet.trusted(red=red, green=green, blue=blue) for red, green, blue in parse_draws(body)]
+
+
 class Game():
     def __init__(self, game_number : int = 0, extractions: list[CubeSet] = []):
         self.__game_number = game_number
         self.__extractions = extractions
+        self.__body = None
+
+    @classmethod
+    def lazy(cls, line: bytes):
+        # Only the game number is read: the draws stay in the raw line until
+        # `extractions` (or `minimal_cube_set`) needs them.
+        game_number, body = split_game(line)
+        game = cls(game_number=game_number, extractions=None)
+        game.__body = body
+        return game
     
     @classmethod
     def parse_game(cls, game_string: str):
@@ -107,9 +137,14 @@ class Game():
         game_number = int(digit_pattern.findall(game_number)[0])
         extractions = [CubeSet.parse_cubeset(e) for e in extractions.split(';')]
         return cls(game_number=game_number, extractions=extractions)
+
+    @classmethod
+    def parse_game_bytes(cls, line: bytes):
+        game_number, body = split_game(line)
+        return cls(game_number=game_number, extractions=cube_sets(body))
     
     def __repr__(self):
-        extractions = '\n'.join([f' -> {repr(e)}' for e in self.__extractions])
+        extractions = '\n'.join([f' -> {repr(e)}' for e in self.extractions])
         return f'Game {self.__game_number}:\n' + extractions
         
     @property
@@ -122,56 +157,88 @@ class Game():
             self.__game_number = value
         else:
             raise ValueError("game number should be >= 0")
+
+    @property
+    def extractions(self) -> list[CubeSet]:
+        if self.__extractions is None:
+            self.__extractions = cube_sets(self.__body)
+            self.__body = None
+        return self.__extractions
     
     @CachedProperty
     def minimal_cube_set(self) -> CubeSet:
-        minimal = CubeSet()
-        for e in self.__extractions:
-            if e.red > minimal.red:
-                minimal.red = e.red
-            if e.green > minimal.green:
-                minimal.green = e.green
-            if e.blue > minimal.blue:
-                minimal.blue = e.blue
-        return minimal
+        red = green = blue = 0
+        for e in self.extractions:
+            if e.red > red:
+                red = e.red
+            if e.green > green:
+                green = e.green
+            if e.blue > blue:
+                blue = e.blue
+        return CubeSet.trusted(red=red, blue=blue, green=green)
 
     @CachedProperty
     def minimal_power(self) -> int:
         minimal = self.minimal_cube_set
         return minimal.power
 
-    @CachedProperty
-    def possible(self):
-        for e in self.__extractions:
-            if not e.possible:
-                return False
-        return True
+    def is_possible(self, limits: dict[str, int] = max_values) -> bool:
+        if self.__extractions is None:
+            # A lazy game is rejected at the first draw over the limits,
+            # without building any CubeSet.
+            max_red, max_green, max_blue = limits['red'], limits['green'], limits['blue']
+            for draw in self.__body.split(b';'):
+                red, green, blue = parse_draw(draw)
+                if red > max_red or green > max_green or blue > max_blue:
+                    return False
+            return True
+        # A game fits a bag exactly when its minimal cube set does, so any
+        # bag configuration is answered from the cached per-colour maxima.
+        return self.minimal_cube_set.is_possible(limits)
 
+    @property
+    def possible(self) -> bool:
+        return self.is_possible(max_values)
 
 
-def parse_file(file_name: str, verbose:str=False):
+
+def parse_file(file_name: str, verbose:str=False, use_mmap: bool = True, lazy: bool = False):
     games = []
-    with open(join(folder_name, file_name)) as f:
-        for line in f:
-            line = line.strip('\n')
-            g = Game.parse_game(line)
-            games.append(g)
-            if verbose:
-                print(f'{g}\nMinimal {g.minimal_cube_set} -> Power: {g.minimal_power}\n')
+    build = Game.lazy if lazy else Game.parse_game_bytes
+    for line in iter_lines(join(folder_name, file_name), use_mmap=use_mmap):
+        g = build(line)
+        games.append(g)
+        if verbose:
+            print(f'{g}\nMinimal {g.minimal_cube_set} -> Power: {g.minimal_power}\n')
     return games
 
 
-def find_possible_games(games: list[Game], verbose=False):
+def find_possible_games(games: list[Game], verbose=False, limits: dict[str, int] = max_values):
+    if not verbose:
+        return [g.game_number for g in games if g.is_possible(limits)]
     possible_games = []
     for g in games:
-        possible = g.possible
+        possible = g.is_possible(limits)
         if possible:
             possible_games.append(g.game_number)
-        if verbose:
-            print("Game {} is {}".format(g.game_number, 'possible' if possible else 'not possible'))
+        print("Game {} is {}".format(g.game_number, 'possible' if possible else 'not possible'))
     return possible_games
 
 
+def parse(data: bytes) -> list[Game]:
+    with stage('day_2.event_2.parse') as record:
+        games = [Game.parse_game_bytes(line) for line in data.splitlines()]
+        record.count('lines', len(games))
+    return games
+
+
+def solve(games: list[Game]) -> int:
+    with stage('day_2.event_2.solve') as record:
+        total = sum([g.minimal_power for g in games])
+        record.count('games', len(games))
+    return total
+
+
 if __name__ == '__main__':
     games = parse_file('input_1.txt', verbose=False)
     possible_games = find_possible_games(games, verbose=False)
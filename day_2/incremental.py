@@ -0,0 +1,35 @@
+import sys
+from os.path import join
+
+from common.incremental import update
+from day_2.event_2 import Game, folder_name, max_values
+
+
+def new_state() -> dict:
+    return {'possible': 0, 'power': 0}
+
+
+def consume(state: dict, line: bytes):
+    # Every line is a game of its own, as in the full parse, so it only
+    # adds its own contribution to both sums.
+    game = Game.parse_game_bytes(line)
+    if game.is_possible(max_values):
+        state['possible'] += game.game_number
+    state['power'] += game.minimal_power
+
+
+def solve_games(file_name: str, checkpoint_file: str | None = None,
+                provisional: bool = False) -> tuple[int, int]:
+    # With `provisional`, an unterminated last line is counted when it
+    # parses; otherwise only newline-terminated lines are.
+    state, with_tail = update(join(folder_name, file_name), new_state, consume, checkpoint_file=checkpoint_file)
+    if provisional and with_tail is not None:
+        state = with_tail
+    return state['possible'], state['power']
+
+
+if __name__ == '__main__':
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'input_1.txt'
+    possible, power = solve_games(file_name, provisional=True)
+    print("Part 1: {}".format(possible))
+    print("Part 2: {}".format(power))
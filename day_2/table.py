@@ -0,0 +1,106 @@
+import numpy as np
+from os.path import join
+
+from day_2.event_2 import Game, digit_pattern, folder_name, max_values, number_color_pattern
+
+colors = ('red', 'green', 'blue')
+color_index = {c: i for i, c in enumerate(colors)}
+batch_cells = 1 << 24
+
+
+def limit_array(limits) -> np.ndarray:
+    # Limits are either a colour dict or (red, green, blue) rows.
+    if isinstance(limits, dict):
+        limits = [limits[c] for c in colors]
+    return np.asarray(limits, dtype=np.int64).reshape(-1, len(colors))
+
+
+class GameTable():
+    def __init__(self, game_ids: np.ndarray, offsets: np.ndarray, counts: np.ndarray):
+        self.__game_ids = game_ids
+        self.__offsets = offsets
+        self.__counts = counts
+        self.__maxima = None
+
+    def __repr__(self):
+        return f'GameTable({len(self)} games, {len(self.__counts)} draws)'
+
+    def __len__(self):
+        return len(self.__game_ids)
+
+    @classmethod
+    def parse_lines(cls, lines):
+        game_ids, offsets, counts = [], [], []
+        for line in lines:
+            game_number, extractions = line.strip('\n').split(':')
+            game_ids.append(int(digit_pattern.findall(game_number)[0]))
+            offsets.append(len(counts))
+            for e in extractions.split(';'):
+                draw = [0, 0, 0]
+                for n, c in number_color_pattern.findall(e):
+                    draw[color_index[c]] = int(n)
+                counts.append(draw)
+        return cls(np.array(game_ids, dtype=np.int64),
+                   np.array(offsets, dtype=np.int64),
+                   np.array(counts, dtype=np.int64).reshape(-1, len(colors)))
+
+    @classmethod
+    def from_games(cls, games: list[Game]):
+        # One row per game holding its minimal cube set: the maxima of a
+        # single draw are the draw itself.
+        minimal = [g.minimal_cube_set for g in games]
+        counts = [[m.red, m.green, m.blue] for m in minimal]
+        return cls(np.array([g.game_number for g in games], dtype=np.int64),
+                   np.arange(len(games), dtype=np.int64),
+                   np.array(counts, dtype=np.int64).reshape(-1, len(colors)))
+
+    @classmethod
+    def from_file(cls, file_name: str):
+        with open(join(folder_name, file_name)) as f:
+            return cls.parse_lines(f)
+
+    @property
+    def game_ids(self) -> np.ndarray:
+        return self.__game_ids
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self.__offsets
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self.__counts
+
+    @property
+    def maxima(self) -> np.ndarray:
+        # Per-game maximum of each colour, i.e. the minimal cube set.
+        if self.__maxima is None:
+            self.__maxima = np.maximum.reduceat(self.__counts, self.__offsets, axis=0)
+        return self.__maxima
+
+    def possible(self, limits=max_values) -> np.ndarray:
+        return (self.maxima <= limit_array(limits)[0]).all(axis=1)
+
+    def find_possible_games(self, limits=max_values) -> np.ndarray:
+        return self.__game_ids[self.possible(limits)]
+
+    def possible_many(self, limits) -> np.ndarray:
+        # Shape (n_limits, n_games): one row per bag configuration.
+        limits = limit_array(limits)
+        return (self.maxima[None, :, :] <= limits[:, None, :]).all(axis=2)
+
+    def sum_possible_many(self, limits) -> np.ndarray:
+        limits = limit_array(limits)
+        step = max(1, batch_cells // max(1, len(self)))
+        sums = [self.possible_many(limits[i:i + step]) @ self.__game_ids
+                for i in range(0, len(limits), step)]
+        return np.concatenate(sums) if sums else np.zeros(0, dtype=np.int64)
+
+    def minimal_powers(self) -> np.ndarray:
+        return self.maxima.prod(axis=1)
+
+
+if __name__ == '__main__':
+    table = GameTable.from_file('input_1.txt')
+    print("Part 1: {}".format(int(table.find_possible_games().sum())))
+    print("Part 2: {}".format(int(table.minimal_powers().sum())))
@@ -0,0 +1,53 @@
+from common.caching import memoize
+
+red, green, blue = 0, 1, 2
+colors = ('red', 'green', 'blue')
+color_codes = {ord('r'): red, ord('g'): green, ord('b'): blue}
+
+
+def split_game(line: bytes) -> tuple[int, bytes]:
+    # `Game N: draws` -> (N, b' draws'), with no regex and no decoding.
+    head, _, body = line.partition(b':')
+    return int(head[5:]), body
+
+
+@memoize(maxsize=1 << 16)
+def parse_draw(draw: bytes) -> tuple[int, int, int]:
+    # Cube counts of one draw as (red, green, blue), read from the first
+    # letter of each colour. Logs repeat the same draws a lot, and the
+    # counts are immutable, so they are memoised.
+    counts = [0, 0, 0]
+    for cube in draw.split(b','):
+        token = cube.split()
+        if token:
+            counts[color_codes[token[1][0]]] = int(token[0])
+    return counts[red], counts[green], counts[blue]
+
+
+def parse_draws(body: bytes) -> list[tuple[int, int, int]]:
+    return [parse_draw(draw) for draw in body.split(b';')]
+
+
+if __name__ == '__main__':
+    import random
+    import timeit
+
+    from day_2 import tokenizer
+    from day_2.event_2 import Game
+    from tools.generate import game_lines
+
+    # Generated games are all distinct, so parse_draw only hits its cache on
+    # draws that really repeat; the cache is emptied before every run.
+    text_lines = list(game_lines(random.Random(0), n_games=10000))
+    raw_lines = [line.encode() for line in text_lines]
+
+    def parse_raw():
+        tokenizer.parse_draw.cache_clear()
+        return [Game.parse_game_bytes(line) for line in raw_lines]
+
+    regex_time = min(timeit.repeat(lambda: [Game.parse_game(line) for line in text_lines], number=1, repeat=5))
+    tokenizer_time = min(timeit.repeat(parse_raw, number=1, repeat=5))
+    print("Parsed {} generated lines".format(len(raw_lines)))
+    print("regex:     {:.4f} s".format(regex_time))
+    print("tokenizer: {:.4f} s ({:.1f}x)".format(tokenizer_time, regex_time / tokenizer_time))
+    print("parse_draw cache: {}".format(tokenizer.parse_draw.stats()))
@@ -0,0 +1,144 @@
+import re
+
+from common.caching import invalidate
+from day_3.schematic import Grid, Schematic, blank, digits, input_file_name
+
+asterix_pattern = re.compile(rb'\*')
+
+
+class EditableSchematic(Schematic):
+    def __init__(self, grid: Grid):
+        if not isinstance(grid.data, bytearray):
+            grid = Grid(bytearray(grid.data))
+        super().__init__(grid)
+        self.__runs = {}
+        self.__cell_run = {}
+        self.__parts = {}
+        self.__gears = {}
+        self.__part_sum = 0
+        self.__gear_sum = 0
+        for row, (b, e), num in self.find_all_numbers():
+            self.__add_run(row, b, e, num)
+        for key in list(self.__runs):
+            self.__update_part(key)
+        for row, (col, _), _ in self.find_all(asterix_pattern):
+            self.__update_gear(row, col)
+
+    @property
+    def part_sum(self) -> int:
+        return self.__part_sum
+
+    @property
+    def gear_sum(self) -> int:
+        return self.__gear_sum
+
+    @property
+    def part_numbers(self) -> dict[tuple[int, int], int]:
+        return dict(self.__parts)
+
+    @property
+    def gear_ratios(self) -> dict[tuple[int, int], int]:
+        return dict(self.__gears)
+
+    def __is_digit(self, p0, p1) -> bool:
+        return self.cell(p0, p1) in digits
+
+    def __add_run(self, row, b, e, num):
+        self.__runs[(row, b)] = (e, num)
+        for col in range(b, e):
+            self.__cell_run[(row, col)] = (row, b)
+
+    def __remove_run(self, key):
+        row, b = key
+        e, _ = self.__runs.pop(key)
+        for col in range(b, e):
+            del self.__cell_run[(row, col)]
+        num = self.__parts.pop(key, None)
+        if num is not None:
+            self.__part_sum -= num
+
+    def __update_part(self, key):
+        row, b = key
+        e, num = self.__runs[key]
+        previous = self.__parts.pop(key, None)
+        if previous is not None:
+            self.__part_sum -= previous
+        for p in self.available_positions(row, b, e):
+            c = self.cell(p[0], p[1])
+            if (c not in digits) and (c != blank):
+                self.__parts[key] = num
+                self.__part_sum += num
+                return
+
+    def __update_gear(self, row, col):
+        previous = self.__gears.pop((row, col), None)
+        if previous is not None:
+            self.__gear_sum -= previous
+        if self.cell(row, col) != '*':
+            return
+        keys = {self.__cell_run[p] for p in self.available_positions(row, col, col + 1) if p in self.__cell_run}
+        if len(keys) == 2:
+            first, second = keys
+            ratio = self.__runs[first][1] * self.__runs[second][1]
+            self.__gears[(row, col)] = ratio
+            self.__gear_sum += ratio
+
+    def set_cell(self, row: int, col: int, ch: str):
+        max_0, max_1 = self.dimensions
+        if not (0 <= row < max_0 and 0 <= col < max_1):
+            raise IndexError("cell ({}, {}) is outside the schematic".format(row, col))
+        if len(ch) != 1 or ch == '\n' or ord(ch) > 127:
+            raise ValueError("`ch` should be a single ASCII character other than a newline")
+        if self.cell(row, col) == ch:
+            return
+
+        # The number runs of this row next to the cell may grow, shrink,
+        # split or merge, so they are dropped and rescanned.
+        old_keys = {self.__cell_run[(row, c)] for c in (col - 1, col, col + 1) if (row, c) in self.__cell_run}
+        lo, hi = col, col + 1
+        touched = {(row, col)}
+        for key in old_keys:
+            b, e = key[1], self.__runs[key][0]
+            lo, hi = min(lo, b), max(hi, e)
+            touched.update((row, c) for c in range(b, e))
+            self.__remove_run(key)
+
+        self.grid[row, col] = ch
+        if (ch not in digits) and (ch != blank) and ch not in self.symbols:
+            invalidate(self, 'symbols')
+
+        new_keys = []
+        c = lo
+        while c < hi:
+            if not self.__is_digit(row, c):
+                c += 1
+                continue
+            b = c
+            while c < max_1 and self.__is_digit(row, c):
+                c += 1
+            start = self.grid.offset(row, b)
+            self.__add_run(row, b, c, int(self.grid.data[start:start + c - b]))
+            new_keys.append((row, b))
+            touched.update((row, x) for x in range(b, c))
+
+        # Only runs next to the edited cell can gain or lose a symbol, and only
+        # stars next to a changed run (or the cell itself) can change gear.
+        affected = set(new_keys)
+        affected.update(self.__cell_run[p] for p in self.available_positions(row, col, col + 1)
+                        if p in self.__cell_run)
+        for key in affected:
+            self.__update_part(key)
+
+        stars = {(row, col)}
+        for p0, p1 in touched:
+            for p in self.available_positions(p0, p1, p1 + 1) + [(p0, p1)]:
+                if self.cell(p[0], p[1]) == '*':
+                    stars.add(p)
+        for p0, p1 in stars:
+            self.__update_gear(p0, p1)
+
+
+if __name__ == '__main__':
+    schematic = EditableSchematic.from_file(input_file_name())
+    print("Event 1:", schematic.part_sum)
+    print("Event 2:", schematic.gear_sum)
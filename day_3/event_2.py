@@ -1,117 +1,46 @@
 import re
-from os.path import join
+
+from common.instrumentation import stage
+from day_3.schematic import Grid, Schematic, input_file_name
 
 verbose = False
 example_file = False
-folder_name = 'day_3'
 
+asterix_pattern = re.compile(rb'\*')
 
-def parse_input(example=False):
-    file_name = 'input_1{}.txt'.format('_example' if example else '')
-    file_content = []
-    with open(join(folder_name, file_name)) as f:
-        for line in f:
-            line = line.strip('\n')
-            file_content.append([c for c in line])
-            if verbose:
-                print([c for c in line])
-                if len(file_content) == 10:
-                    break
-    return file_content
-
-
-file_content = parse_input(example_file)
-dimensions = len(file_content), len(file_content[0])
-
-
-digits = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
-blank = '.'
-
-def find_symbols(file_content):
-    unique = set([el for row in file_content for el in row])
-    return [e for e in unique if (e not in digits) and (e != blank)]
-
-symbols = find_symbols(file_content=file_content)
-
-number_pattern = re.compile('\d+')
-asterix_pattern = re.compile('\*')
-
-def check_positions(pos_0, pos_1, min_0=0, min_1=0, max_0=dimensions[0], max_1=dimensions[1]):
-    if (pos_0 < min_0) or (pos_0 == max_0):
-        return False
-    if (pos_1 < min_1) or (pos_1 == max_1):
-        return False
-    return True
-
-
-def available_positions(pos_0, pos_1_b, pos_1_e, min_0=0, min_1=0, max_0=dimensions[0], max_1=dimensions[1]):
-    positions = []
-    if pos_1_b > min_1:
-        positions.append((pos_0, pos_1_b - 1))
-        if check_positions(pos_0 - 1, pos_1_b, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 - 1, pos_1_b - 1))
-        if check_positions(pos_0 + 1, pos_1_b, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 + 1, pos_1_b - 1))
-    if pos_1_e < max_1:
-        positions.append((pos_0, pos_1_e))
-        if check_positions(pos_0 - 1, pos_1_e, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 - 1, pos_1_e))
-        if check_positions(pos_0 + 1, pos_1_e, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 + 1, pos_1_e))
-    for p in range(pos_1_b, pos_1_e):
-        if check_positions(pos_0 - 1, p, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 - 1, p))
-        if check_positions(pos_0 + 1, p, max_0=max_0, max_1=max_1):
-            positions.append((pos_0 + 1, p))
-    return positions
-
-
-def find_all_numbers(file_content) -> tuple[int, tuple[int, int], int]:
-    all_matches = []
-    for i, line in enumerate(file_content):
-        string = ''.join(line)
-        matches = number_pattern.finditer(string)
-        for m in matches:
-            pos_1 = m.span()
-            all_matches.append((i, pos_1, int(m.group(0))))
-    return all_matches
-
-
-def find_all_asterix(file_content) -> tuple[int, tuple[int, int], str]:
-    all_matches = []
-    for i, line in enumerate(file_content):
-        string = ''.join(line)
-        matches = asterix_pattern.finditer(string)
-        for m in matches:
-            pos_1 = m.span()
-            all_matches.append((i, pos_1, m.group(0)))
-    return all_matches
-
-
-def check_asterix(p0, p1, file_content) -> bool:
-    if file_content[p0][p1] == '*':
+
+def find_all_asterix(schematic: Schematic) -> list[tuple[int, tuple[int, int], str]]:
+    return [(i, pos_1, ast.decode()) for i, pos_1, ast in schematic.find_all(asterix_pattern)]
+
+
+def check_asterix(p0, p1, schematic: Schematic) -> bool:
+    if schematic.cell(p0, p1) == '*':
         return True
     return False
 
 
-def check_number(p0, p1, all_numbers) -> tuple[int, tuple[int, int], int] | None:
+def index_numbers(all_numbers) -> dict[tuple[int, int], tuple[int, tuple[int, int], int]]:
+    number_index = {}
     for y, (b, e), num in all_numbers:
-        if (p0 == y) and (p1 >= b) and (p1 < e):
-            return y, (b, e), num
-    return None
+        for x in range(b, e):
+            number_index[(y, x)] = (y, (b, e), num)
+    return number_index
+
 
+def check_number(p0, p1, number_index) -> tuple[int, tuple[int, int], int] | None:
+    return number_index.get((p0, p1))
 
-def find_gears(file_content):
-    dimensions = len(file_content), len(file_content[0])
-    all_numbers = find_all_numbers(file_content)
-    all_asterix = find_all_asterix(file_content)
+
+def find_gears(schematic: Schematic):
+    number_index = index_numbers(schematic.find_all_numbers())
+    all_asterix = find_all_asterix(schematic)
     gears = {}
     for pos_0, (b, e), ast in all_asterix:
         if verbose:
             print(f'{ast} -> ({pos_0}, [{b}:{e}])')
-        positions = available_positions(pos_0, b, e, max_0=dimensions[0], max_1=dimensions[1])
+        positions = schematic.available_positions(pos_0, b, e)
         for p in positions:
-            numbers = check_number(p[0], p[1], all_numbers)
+            numbers = check_number(p[0], p[1], number_index)
             if verbose:
                 print(f'     -> ({p[0], p[1]}) : ', end='')
                 if numbers is not None:
@@ -132,13 +61,33 @@ def get_gear_ratio(gear: list[tuple[int, tuple[int, int], int]]):
     return gear[0][2] * gear[1][2]
 
 
-gears = find_gears(file_content)
-if verbose:
-    for k, v in gears.items():
-        print(k, v)
+def parse(data: bytes) -> Schematic:
+    with stage('day_3.event_2.parse') as record:
+        schematic = Schematic(Grid(data))
+        record.count('cells', schematic.grid.width * schematic.grid.height)
+    return schematic
+
+
+def solve(schematic: Schematic) -> int:
+    with stage('day_3.event_2.solve') as record:
+        gears = find_gears(schematic)
+        record.count('gears', len(gears))
+    return sum([get_gear_ratio(v) for v in gears.values()])
+
+
+def main(file_name: str | None = None):
+    if file_name is None:
+        file_name = input_file_name(example_file)
+    schematic = Schematic.from_file(file_name, verbose=verbose)
+    gears = find_gears(schematic)
+    if verbose:
+        for k, v in gears.items():
+            print(k, v)
 
-gear_ratios = {k: get_gear_ratio(v) for k, v in gears.items()}
+    gear_ratios = {k: get_gear_ratio(v) for k, v in gears.items()}
 
-print("Event 1:", sum([v for k, v in gear_ratios.items()]))
+    print("Event 1:", sum([v for k, v in gear_ratios.items()]))
 
 
+if __name__ == '__main__':
+    main()
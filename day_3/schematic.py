@@ -0,0 +1,154 @@
+import mmap
+import re
+from os.path import join
+
+from common.caching import CachedProperty
+
+folder_name = 'day_3'
+
+digits = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+blank = '.'
+
+newline = ord('\n')
+number_pattern = re.compile(rb'\d+')
+
+
+def input_file_name(example=False):
+    return 'input_1{}.txt'.format('_example' if example else '')
+
+
+class Grid():
+    def __init__(self, data: bytes | bytearray | mmap.mmap):
+        self.__data = data
+        width = data.find(b'\n')
+        self.__width = width if width >= 0 else len(data)
+        self.__stride = self.__width + 1
+        self.__height = (len(data) + 1) // self.__stride
+
+    @classmethod
+    def from_file(cls, file_name: str, use_mmap=False):
+        with open(join(folder_name, file_name), 'rb') as f:
+            if use_mmap:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return cls(f.read())
+
+    @property
+    def data(self) -> bytes | bytearray | mmap.mmap:
+        return self.__data
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    @property
+    def stride(self) -> int:
+        return self.__stride
+
+    def offset(self, row, col) -> int:
+        return row * self.__stride + col
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        row, col = position
+        return chr(self.__data[row * self.__stride + col])
+
+    def __setitem__(self, position: tuple[int, int], value: str):
+        row, col = position
+        self.__data[row * self.__stride + col] = ord(value)
+
+    def row(self, row) -> bytes:
+        start = row * self.__stride
+        return bytes(self.__data[start:start + self.__width])
+
+    def unique(self, chunk_size=1 << 24) -> set[str]:
+        seen = set()
+        for start in range(0, len(self.__data), chunk_size):
+            seen.update(self.__data[start:start + chunk_size])
+        seen.discard(newline)
+        return {chr(c) for c in seen}
+
+    def finditer(self, pattern: re.Pattern):
+        # Matches never span a newline for the patterns used here, so the
+        # whole buffer is scanned at once and offsets are mapped back to cells.
+        for m in pattern.finditer(self.__data):
+            row, b = divmod(m.start(), self.__stride)
+            yield row, (b, b + m.end() - m.start()), m.group(0)
+
+
+def parse_input(file_name: str, verbose=False, use_mmap=False) -> Grid:
+    grid = Grid.from_file(file_name, use_mmap=use_mmap)
+    if verbose:
+        for i in range(min(grid.height, 10)):
+            print(list(grid.row(i).decode()))
+    return grid
+
+
+def find_symbols(grid: Grid):
+    return [e for e in grid.unique() if (e not in digits) and (e != blank)]
+
+
+def check_positions(pos_0, pos_1, max_0, max_1, min_0=0, min_1=0):
+    if (pos_0 < min_0) or (pos_0 == max_0):
+        return False
+    if (pos_1 < min_1) or (pos_1 == max_1):
+        return False
+    return True
+
+
+def available_positions(pos_0, pos_1_b, pos_1_e, max_0, max_1, min_0=0, min_1=0):
+    positions = []
+    if pos_1_b > min_1:
+        positions.append((pos_0, pos_1_b - 1))
+        if check_positions(pos_0 - 1, pos_1_b, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 - 1, pos_1_b - 1))
+        if check_positions(pos_0 + 1, pos_1_b, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 + 1, pos_1_b - 1))
+    if pos_1_e < max_1:
+        positions.append((pos_0, pos_1_e))
+        if check_positions(pos_0 - 1, pos_1_e, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 - 1, pos_1_e))
+        if check_positions(pos_0 + 1, pos_1_e, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 + 1, pos_1_e))
+    for p in range(pos_1_b, pos_1_e):
+        if check_positions(pos_0 - 1, p, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 - 1, p))
+        if check_positions(pos_0 + 1, p, max_0=max_0, max_1=max_1):
+            positions.append((pos_0 + 1, p))
+    return positions
+
+
+class Schematic():
+    def __init__(self, grid: Grid):
+        self.__grid = grid
+
+    @classmethod
+    def from_file(cls, file_name: str, verbose=False, use_mmap=False):
+        return cls(parse_input(file_name, verbose=verbose, use_mmap=use_mmap))
+
+    @property
+    def grid(self) -> Grid:
+        return self.__grid
+
+    @property
+    def dimensions(self) -> tuple[int, int]:
+        return self.__grid.height, self.__grid.width
+
+    @CachedProperty
+    def symbols(self) -> list[str]:
+        return find_symbols(self.__grid)
+
+    def cell(self, p0, p1) -> str:
+        return self.__grid[p0, p1]
+
+    def available_positions(self, pos_0, pos_1_b, pos_1_e):
+        max_0, max_1 = self.dimensions
+        return available_positions(pos_0, pos_1_b, pos_1_e, max_0=max_0, max_1=max_1)
+
+    def find_all(self, pattern: re.Pattern) -> list[tuple[int, tuple[int, int], bytes]]:
+        return list(self.__grid.finditer(pattern))
+
+    def find_all_numbers(self) -> list[tuple[int, tuple[int, int], int]]:
+        return [(i, pos_1, int(num)) for i, pos_1, num in self.__grid.finditer(number_pattern)]
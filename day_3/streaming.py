@@ -0,0 +1,111 @@
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from os.path import join
+from typing import Iterable, Iterator
+
+from day_3.schematic import folder_name, number_pattern
+
+not_symbols = b'0123456789.'
+
+
+def row_numbers(row: bytes) -> tuple[list[int], list[int], list[int]]:
+    starts, ends, values = [], [], []
+    for m in number_pattern.finditer(row):
+        starts.append(m.start())
+        ends.append(m.end())
+        values.append(int(m.group(0)))
+    return starts, ends, values
+
+
+def has_symbol(row: bytes | None, lo: int, hi: int) -> bool:
+    return row is not None and len(row[lo:hi].translate(None, not_symbols)) > 0
+
+
+def adjacent_numbers(numbers, col: int) -> list[int]:
+    # Numbers are sorted and never overlap, so both their starts and ends are
+    # increasing and the ones touching columns col-1..col+1 are a slice.
+    if numbers is None:
+        return []
+    starts, ends, values = numbers
+    return values[bisect_left(ends, col):bisect_right(starts, col + 1)]
+
+
+def scan_row(index: int, previous, current, following) -> Iterator[tuple[str, int, int, int]]:
+    row, numbers = current
+    above, above_numbers = previous if previous is not None else (None, None)
+    below, below_numbers = following if following is not None else (None, None)
+    for b, e, num in zip(*numbers):
+        lo, hi = max(b - 1, 0), e + 1
+        if has_symbol(above, lo, hi) or has_symbol(row, lo, hi) or has_symbol(below, lo, hi):
+            yield 'part', index, b, num
+    col = row.find(b'*')
+    while col >= 0:
+        neighbours = (adjacent_numbers(above_numbers, col) + adjacent_numbers(numbers, col)
+                      + adjacent_numbers(below_numbers, col))
+        if len(neighbours) == 2:
+            yield 'gear', index, col, neighbours[0] * neighbours[1]
+        col = row.find(b'*', col + 1)
+
+
+def scan_rows(rows: Iterable[bytes], first_row: int = 0,
+              own: range | None = None) -> Iterator[tuple[str, int, int, int]]:
+    # Only three rows are held at a time. Results are emitted for the rows in
+    # `own`, the others only serve as neighbours.
+    previous = current = None
+    index = first_row - 1
+    for row in rows:
+        row = row.rstrip(b'\n')
+        following = (row, row_numbers(row))
+        if current is not None and (own is None or index in own):
+            yield from scan_row(index, previous, current, following)
+        previous, current = current, following
+        index += 1
+    if current is not None and (own is None or index in own):
+        yield from scan_row(index, previous, current, None)
+
+
+def sum_rows(rows: Iterable[bytes], first_row: int = 0, own: range | None = None) -> tuple[int, int]:
+    sums = {'part': 0, 'gear': 0}
+    for kind, _, _, value in scan_rows(rows, first_row=first_row, own=own):
+        sums[kind] += value
+    return sums['part'], sums['gear']
+
+
+def scan_band(path: str, stride: int, n_rows: int, start: int, stop: int) -> tuple[int, int]:
+    # A band reads one extra row on each side. Every number and star is
+    # owned by the band holding its row and sees all of its neighbours, so
+    # gears spanning a band boundary are counted exactly once.
+    first = max(start - 1, 0)
+    last = min(stop + 1, n_rows)
+    with open(path, 'rb') as f:
+        f.seek(first * stride)
+        return sum_rows(islice(f, last - first), first_row=first, own=range(start, stop))
+
+
+def stream_sums(file_name: str, workers: int = 1, band_rows: int | None = None) -> tuple[int, int]:
+    path = join(folder_name, file_name)
+    if workers <= 1:
+        with open(path, 'rb') as f:
+            return sum_rows(f)
+
+    with open(path, 'rb') as f:
+        stride = len(f.readline().rstrip(b'\n')) + 1
+    n_rows = (os.path.getsize(path) + 1) // stride
+    band_rows = band_rows if band_rows is not None else max(1, -(-n_rows // workers))
+    starts = list(range(0, n_rows, band_rows))
+    stops = [min(s + band_rows, n_rows) for s in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        bands = list(executor.map(scan_band, [path] * len(starts), [stride] * len(starts),
+                                  [n_rows] * len(starts), starts, stops))
+    return sum(p for p, _ in bands), sum(g for _, g in bands)
+
+
+if __name__ == '__main__':
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'input_1.txt'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    part_sum, gear_sum = stream_sums(file_name, workers=workers)
+    print("Event 1:", part_sum)
+    print("Event 2:", gear_sum)
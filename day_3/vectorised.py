@@ -0,0 +1,113 @@
+import numpy as np
+from os.path import join
+from scipy import ndimage
+
+folder_name = 'day_3'
+
+newline = ord('\n')
+blank = ord('.')
+asterix = ord('*')
+zero, nine = ord('0'), ord('9')
+
+powers_of_ten = 10 ** np.arange(19, dtype=np.int64)
+row_structure = np.array([[0, 0, 0], [1, 1, 1], [0, 0, 0]], dtype=bool)
+
+
+def parse_grid(data: bytes) -> np.ndarray:
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if buffer.size and buffer[-1] != newline:
+        buffer = np.append(buffer, np.uint8(newline))
+    width = int(np.argmax(buffer == newline))
+    return buffer.reshape(-1, width + 1)[:, :width]
+
+
+def load_grid(file_name: str) -> np.ndarray:
+    with open(join(folder_name, file_name), 'rb') as f:
+        return parse_grid(f.read())
+
+
+class VectorisedSchematic():
+    def __init__(self, grid: np.ndarray):
+        self.__grid = grid
+        self.__digit_mask = (grid >= zero) & (grid <= nine)
+        self.__labels, self.__n_numbers = ndimage.label(self.__digit_mask, structure=row_structure)
+        self.__runs = None
+
+    @property
+    def grid(self) -> np.ndarray:
+        return self.__grid
+
+    @property
+    def labels(self) -> np.ndarray:
+        return self.__labels
+
+    @property
+    def symbol_mask(self) -> np.ndarray:
+        return ~self.__digit_mask & (self.__grid != blank)
+
+    def __number_runs(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Labels are assigned in raster order, so the digit cells of a number
+        # are contiguous in the flattened array of digit positions.
+        if self.__runs is None:
+            cells = np.flatnonzero(self.__digit_mask)
+            run_labels = self.__labels.ravel()[cells]
+            starts = np.flatnonzero(np.diff(run_labels, prepend=0))
+            lengths = np.diff(np.append(starts, cells.size))
+            ends = np.repeat(starts + lengths, lengths)
+            exponents = ends - np.arange(cells.size) - 1
+            digits = self.__grid.ravel()[cells].astype(np.int64) - zero
+            if cells.size:
+                values = np.add.reduceat(digits * powers_of_ten[exponents], starts)
+            else:
+                values = np.zeros(0, dtype=np.int64)
+            self.__runs = cells[starts], lengths, values
+        return self.__runs
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.__number_runs()[2]
+
+    def number(self, label: int) -> tuple[int, tuple[int, int], int]:
+        starts, lengths, values = self.__number_runs()
+        row, col = divmod(int(starts[label - 1]), self.__grid.shape[1])
+        return row, (col, col + int(lengths[label - 1])), int(values[label - 1])
+
+    def part_number_mask(self) -> np.ndarray:
+        # A 3x3 maximum filter is the same dilation as a 3x3 structuring
+        # element, but scipy applies it separably along each axis.
+        adjacent = ndimage.maximum_filter(self.symbol_mask, size=3)
+        touched = np.zeros(self.__n_numbers + 1, dtype=bool)
+        touched[self.__labels[adjacent & self.__digit_mask]] = True
+        return touched[1:]
+
+    def find_summable_numbers(self) -> list[int]:
+        return self.values[self.part_number_mask()].tolist()
+
+    def __gear_candidates(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows, cols = np.nonzero(self.__grid == asterix)
+        padded = np.pad(self.__labels, 1)
+        neighbours = np.stack([padded[rows + 1 + dr, cols + 1 + dc]
+                               for dr in (-1, 0, 1) for dc in (-1, 0, 1)], axis=1)
+        neighbours.sort(axis=1)
+        distinct = (neighbours[:, 1:] != neighbours[:, :-1]) & (neighbours[:, 1:] != 0)
+        count = distinct.sum(axis=1) + (neighbours[:, 0] != 0)
+        first = np.where(neighbours == 0, np.iinfo(neighbours.dtype).max, neighbours).min(axis=1)
+        last = neighbours[:, -1]
+        is_gear = count == 2
+        return np.stack([rows[is_gear], cols[is_gear]], axis=1), first[is_gear], last[is_gear]
+
+    def gear_ratios(self) -> np.ndarray:
+        _, first, last = self.__gear_candidates()
+        values = self.values
+        return values[first - 1] * values[last - 1]
+
+    def find_gears(self) -> dict[tuple[int, tuple[int, int]], list[tuple[int, tuple[int, int], int]]]:
+        positions, first, last = self.__gear_candidates()
+        return {(int(r), (int(c), int(c) + 1)): [self.number(a), self.number(b)]
+                for (r, c), a, b in zip(positions, first, last)}
+
+
+if __name__ == '__main__':
+    schematic = VectorisedSchematic(load_grid('input_1.txt'))
+    print("Event 1:", int(schematic.values[schematic.part_number_mask()].sum()))
+    print("Event 2:", int(schematic.gear_ratios().sum()))
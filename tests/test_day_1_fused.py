@@ -0,0 +1,19 @@
+import pytest
+
+from day_1 import event_1, event_2
+from day_1.fused import calibrate_both, sum_both
+
+
+@pytest.mark.parametrize('file_name, expected', [
+    ('input_1_example.txt', (142, 142)),
+    ('input_2_example.txt', (209, 281)),
+])
+def test_examples(file_name, expected):
+    assert sum_both(file_name) == expected
+
+
+@pytest.mark.parametrize('line', ['two1nine', 'eightwothree', 'xtwone3four', 'zoneight234', '7pqrstsixteen',
+                                  'oneight', '5', 'nine8sevenine'])
+def test_matches_separate_calibration(line):
+    part_1 = event_1.calibrate(line) if any(c.isdigit() for c in line) else 0
+    assert calibrate_both(line) == (part_1, event_2.calibrate(line))
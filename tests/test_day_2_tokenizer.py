@@ -0,0 +1,33 @@
+import random
+from pathlib import Path
+
+from day_2 import event_1, event_2
+from day_2.tokenizer import parse_draw, split_game
+from tools.generate import game_lines
+
+shipped = Path(__file__).resolve().parent.parent / 'day_2' / 'input_1.txt'
+lines = list(game_lines(random.Random(0), n_games=500)) + shipped.read_text().splitlines()
+
+
+def test_bytes_parser_matches_regex_parser():
+    for line in lines:
+        raw = line.encode()
+        assert repr(event_2.Game.parse_game_bytes(raw)) == repr(event_2.Game.parse_game(line))
+        assert repr(event_1.Game.extract_game_bytes(raw)) == repr(event_1.Game.extract_game(line))
+
+
+def test_lazy_games_match_eager_games():
+    limits = [event_2.max_values, {'red': 5, 'green': 6, 'blue': 7}]
+    for line in lines:
+        raw = line.encode()
+        eager = event_2.Game.parse_game_bytes(raw)
+        for bag in limits:
+            assert event_2.Game.lazy(raw).is_possible(bag) == eager.is_possible(bag)
+            assert event_1.Game.lazy(raw).check_game(bag) == event_1.Game.extract_game_bytes(raw).check_game(bag)
+        assert event_2.Game.lazy(raw).minimal_power == eager.minimal_power
+
+
+def test_split_game_and_parse_draw():
+    assert split_game(b'Game 12: 3 blue, 4 red') == (12, b' 3 blue, 4 red')
+    assert parse_draw(b' 3 blue, 4 red') == (4, 0, 3)
+    assert parse_draw(b'') == (0, 0, 0)
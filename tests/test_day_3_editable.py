@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from day_3 import event_1, event_2
+from day_3.editable import EditableSchematic
+from day_3.schematic import Grid
+
+alphabet = '0123456789' * 3 + '.' * 12 + '*#+$'
+
+
+def full_sums(data: bytes) -> tuple[int, int]:
+    return event_1.solve(event_1.parse(data)), event_2.solve(event_2.parse(data))
+
+
+def random_grid(rng: random.Random, height: int, width: int) -> bytearray:
+    return bytearray(b''.join(''.join(rng.choice(alphabet) for _ in range(width)).encode() + b'\n'
+                              for _ in range(height)))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_edits_match_full_solve(seed):
+    rng = random.Random(seed)
+    height, width = rng.randint(1, 12), rng.randint(1, 12)
+    schematic = EditableSchematic(Grid(random_grid(rng, height, width)))
+    assert (schematic.part_sum, schematic.gear_sum) == full_sums(bytes(schematic.grid.data))
+    for _ in range(200):
+        schematic.set_cell(rng.randrange(height), rng.randrange(width), rng.choice(alphabet))
+        assert (schematic.part_sum, schematic.gear_sum) == full_sums(bytes(schematic.grid.data))
+
+
+def test_rejected_edit_leaves_state_unchanged():
+    schematic = EditableSchematic(Grid(bytearray(b'12*\n..3\n')))
+    assert schematic.part_sum == 15
+    with pytest.raises(ValueError):
+        schematic.set_cell(0, 1, '€')
+    with pytest.raises(IndexError):
+        schematic.set_cell(2, 0, '1')
+    assert schematic.part_sum == 15
+    assert bytes(schematic.grid.data) == b'12*\n..3\n'
@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from os.path import join
+
+from tools.generate import generate_input
+from tools.solvers import default_input, solver_module
+
+days = [1, 2, 3]
+parts = [1, 2]
+default_scales = [10, 100, 1000]
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_stages(module, path: str, repeat: int) -> dict:
+    best = {'read': float('inf'), 'parse': float('inf'), 'solve': float('inf')}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            data = f.read()
+        read = time.perf_counter()
+        parsed = module.parse(data)
+        parse = time.perf_counter()
+        answer = module.solve(parsed)
+        solve = time.perf_counter()
+        best['read'] = min(best['read'], read - start)
+        best['parse'] = min(best['parse'], parse - read)
+        best['solve'] = min(best['solve'], solve - parse)
+    return {'answer': answer, 'bytes': len(data), 'seconds': best}
+
+
+def benchmark_input(day: int, label: str, scale: int, path: str, repeat: int, verbose=False) -> list[dict]:
+    results = []
+    for part in parts:
+        stages = time_stages(solver_module(day, part), path, repeat)
+        result = {'day': day, 'part': part, 'input': label, 'scale': scale, **stages}
+        result['mb_per_s'] = stages['bytes'] / 1e6 / max(sum(stages['seconds'].values()), 1e-12)
+        results.append(result)
+        if verbose:
+            print('day {} part {} {:<16} parse {:>9.4f}s  solve {:>9.4f}s  -> {}'.format(
+                day, part, label, stages['seconds']['parse'], stages['seconds']['solve'], stages['answer']))
+    return results
+
+
+def run(selected_days: list[int], scales: list[int], repeat: int = 1, seed: int = 0, verbose=False) -> dict:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for day in selected_days:
+            path = default_input(day)
+            results += benchmark_input(day, path.name, 1, path, repeat, verbose=verbose)
+            for scale in scales:
+                path = join(directory, 'day_{}_x{}.txt'.format(day, scale))
+                generate_input(day, path, scale=scale, seed=seed)
+                label = 'synthetic x{}'.format(scale)
+                results += benchmark_input(day, label, scale, path, repeat, verbose=verbose)
+                os.remove(path)
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time parse and solve stages of every day and part.")
+    parser.add_argument('--days', type=int, nargs='+', default=days)
+    parser.add_argument('--scales', type=int, nargs='*', default=default_scales,
+                        help="synthetic input sizes, as multiples of the shipped input")
+    parser.add_argument('--repeat', type=int, default=1, help="keep the best of this many runs")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="JSON file to write, stdout if omitted")
+    args = parser.parse_args(argv)
+
+    report = run(args.days, args.scales, repeat=args.repeat, seed=args.seed, verbose=args.output is not None)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+
+from tools.solvers import root
+
+default_directory = root / '.cache' / 'results'
+default_max_entries = 1024
+
+
+@lru_cache(maxsize=None)
+def code_version(day: int) -> str:
+    # Any change to the day's modules or to the shared helpers they import
+    # gives a new version, so stale answers are never returned.
+    digest = hashlib.sha256()
+    for folder in ['day_{}'.format(day), 'common']:
+        for path in sorted((root / folder).glob('*.py')):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache():
+    def __init__(self, directory: Path = default_directory, max_entries: int = default_max_entries):
+        self.__directory = Path(directory)
+        self.__max_entries = max_entries
+
+    def __len__(self):
+        return len(self.__entries())
+
+    @property
+    def directory(self) -> Path:
+        return self.__directory
+
+    def key(self, day: int, part: int, digest: str) -> str:
+        return hashlib.sha256('{}|{}|{}|{}'.format(day, part, digest, code_version(day)).encode()).hexdigest()
+
+    def __path(self, key: str) -> Path:
+        return self.__directory / '{}.json'.format(key)
+
+    def __entries(self) -> list[Path]:
+        if not self.__directory.is_dir():
+            return []
+        return list(self.__directory.glob('*.json'))
+
+    def get(self, key: str) -> int | None:
+        path = self.__path(key)
+        try:
+            with open(path) as f:
+                answer = json.load(f)['answer']
+        except (OSError, ValueError, KeyError):
+            return None
+        # The modification time doubles as the last access time for LRU.
+        os.utime(path)
+        return answer
+
+    def put(self, key: str, answer: int, **metadata):
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        path = self.__path(key)
+        temporary = path.with_suffix('.tmp')
+        with open(temporary, 'w') as f:
+            json.dump({'answer': answer, **metadata}, f)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        entries = self.__entries()
+        if len(entries) <= self.__max_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:len(entries) - self.__max_entries]:
+            path.unlink(missing_ok=True)
+
+    def clear(self):
+        shutil.rmtree(self.__directory, ignore_errors=True)
@@ -0,0 +1,66 @@
+import argparse
+import json
+import socket
+from pathlib import Path
+from typing import Iterator
+
+from tools.daemon import default_socket, encode_batch
+from tools.solvers import default_input
+
+
+class SolverClient():
+    def __init__(self, path: Path = default_socket):
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.connect(str(path))
+        self.__lines = self.__socket.makefile('rb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.__lines.close()
+        self.__socket.close()
+
+    def stream(self, requests: list[tuple[int, int, bytes]]) -> Iterator[dict]:
+        # Results are yielded as the daemon finishes them; `id` is the
+        # position of the request in the batch.
+        self.__socket.sendall(encode_batch(requests))
+        for line in self.__lines:
+            result = json.loads(line)
+            if 'done' in result:
+                return
+            yield result
+        raise ConnectionError("the daemon closed the connection mid-batch")
+
+    def solve_many(self, requests: list[tuple[int, int, bytes]]) -> list[dict]:
+        return sorted(self.stream(requests), key=lambda result: result['id'])
+
+    def solve(self, day: int, part: int, data: bytes) -> int:
+        result, = self.solve_many([(day, part, data)])
+        if 'error' in result:
+            raise RuntimeError(result['error'])
+        return result['answer']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send one batch of inputs to a running solver daemon.")
+    parser.add_argument('day', type=int)
+    parser.add_argument('files', type=Path, nargs='*', help="the day's input_1.txt if omitted")
+    parser.add_argument('--parts', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--socket', type=Path, default=default_socket)
+    args = parser.parse_args(argv)
+
+    files = args.files or [default_input(args.day)]
+    requests = [(args.day, part, path.read_bytes()) for path in files for part in args.parts]
+    labels = ['{} part {}'.format(path, part) for path in files for part in args.parts]
+    with SolverClient(args.socket) as client:
+        for result in client.stream(requests):
+            outcome = result['error'] if 'error' in result else result['answer']
+            print('{}: {}'.format(labels[result['id']], outcome))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import importlib
+import json
+import signal
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from tools.run import run_solver
+from tools.solvers import discover_solvers, root
+
+default_socket = root / '.cache' / 'solver.sock'
+default_inline_limit = 1 << 10
+
+# A batch is a 4-byte big-endian header length, a JSON header listing the
+# requests as {"id", "day", "part", "size"}, then every input back to back.
+# Results come back as one JSON line each, in completion order, and a final
+# {"done": count} line closes the batch.
+header_size = struct.Struct('!I')
+
+
+def encode_batch(requests: list[tuple[int, int, bytes]]) -> bytes:
+    header = json.dumps({'requests': [{'id': i, 'day': day, 'part': part, 'size': len(data)}
+                                      for i, (day, part, data) in enumerate(requests)]}).encode()
+    return b''.join([header_size.pack(len(header)), header] + [data for _, _, data in requests])
+
+
+def warm(module_names: list[str]):
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+class SolverDaemon():
+    def __init__(self, workers: int | None = None, inline_limit: int = default_inline_limit):
+        self.__solvers = discover_solvers()
+        self.__inline_limit = inline_limit
+        modules = list(self.__solvers.values())
+        warm(modules)
+        # Workers import every solver up front, so no request pays for it.
+        self.__pool = ProcessPoolExecutor(max_workers=workers, initializer=warm, initargs=(modules,))
+
+    def close(self):
+        self.__pool.shutdown(cancel_futures=True)
+
+    async def solve(self, request: dict, data: bytes) -> dict:
+        result = {'id': request['id'], 'day': request['day'], 'part': request['part']}
+        module_name = self.__solvers.get((request['day'], request['part']))
+        if module_name is None:
+            result['error'] = "no solver for day {} part {}".format(request['day'], request['part'])
+            return result
+        # Shipping a small input to a worker process costs more than solving
+        # it, so it is solved on a thread of the warm server process instead;
+        # the event loop itself never runs a solver.
+        executor = None if len(data) <= self.__inline_limit else self.__pool
+        try:
+            loop = asyncio.get_running_loop()
+            result['answer'], result['seconds'] = await loop.run_in_executor(executor, run_solver, module_name, data)
+        except Exception as error:
+            result['error'] = '{}: {}'.format(type(error).__name__, error)
+        return result
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    length, = header_size.unpack(await reader.readexactly(header_size.size))
+                except asyncio.IncompleteReadError:
+                    break
+                requests = json.loads(await reader.readexactly(length))['requests']
+                tasks = []
+                for request in requests:
+                    data = await reader.readexactly(request['size'])
+                    tasks.append(asyncio.ensure_future(self.solve(request, data)))
+                for task in asyncio.as_completed(tasks):
+                    writer.write(json.dumps(await task).encode() + b'\n')
+                    await writer.drain()
+                writer.write(json.dumps({'done': len(tasks)}).encode() + b'\n')
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, stop.set)
+        server = await asyncio.start_unix_server(self.handle, path=str(path))
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep every solver warm behind a Unix domain socket.")
+    parser.add_argument('--socket', type=Path, default=default_socket)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--inline-limit', type=int, default=default_inline_limit,
+                        help="inputs up to this many bytes are solved on a thread of the server process")
+    args = parser.parse_args(argv)
+
+    daemon = SolverDaemon(workers=args.workers, inline_limit=args.inline_limit)
+    print('Serving on {}'.format(args.socket), flush=True)
+    try:
+        asyncio.run(daemon.serve(args.socket))
+    finally:
+        daemon.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+import argparse
+import random
+import string
+from typing import Iterable, Iterator
+
+digit_words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+colors = ['red', 'green', 'blue']
+symbols = '*#$%&+-/=@'
+
+# Sizes of the shipped input_1.txt files, used as the 1x scale.
+shipped_sizes = {1: 999, 2: 99, 3: 140}
+batch_lines = 1 << 12
+size_units = {'k': 1 << 10, 'm': 1 << 20, 'g': 1 << 30, 't': 1 << 40}
+
+
+def find_overlaps(words: list[str]) -> list[str]:
+    # Spellings sharing letters, such as 'eightwo' or 'oneight', where the
+    # last digit only shows up when overlapping matches are allowed.
+    overlaps = []
+    for a in words:
+        for b in words:
+            for k in range(1, min(len(a), len(b))):
+                if a[-k:] == b[:k]:
+                    overlaps.append(a + b[k:])
+    return overlaps
+
+
+overlapping_words = find_overlaps(digit_words)
+
+
+def calibration_line(rng: random.Random, tokens: int = 8, word_share: float = 0.3,
+                     overlap_share: float = 0.1) -> str:
+    # Every line holds at least one numeric digit, as part 1 requires.
+    parts = [rng.choice(string.digits[1:])]
+    for _ in range(rng.randint(1, tokens)):
+        kind = rng.random()
+        if kind < overlap_share:
+            parts.append(rng.choice(overlapping_words))
+        elif kind < overlap_share + word_share:
+            parts.append(rng.choice(digit_words))
+        elif kind < 0.2 + overlap_share + word_share:
+            parts.append(rng.choice(string.digits[1:]))
+        else:
+            parts.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))))
+    rng.shuffle(parts)
+    return ''.join(parts)
+
+
+def calibration_lines(rng: random.Random, n_lines: int | None = None, **options) -> Iterator[str]:
+    i = 0
+    while n_lines is None or i < n_lines:
+        yield calibration_line(rng, **options)
+        i += 1
+
+
+def game_line(rng: random.Random, game_number: int, min_draws: int = 1, max_draws: int = 6,
+              max_count: int = 20) -> str:
+    draws = []
+    for _ in range(rng.randint(min_draws, max_draws)):
+        chosen = rng.sample(colors, rng.randint(1, 3))
+        draws.append(', '.join('{} {}'.format(rng.randint(1, max_count), c) for c in chosen))
+    return 'Game {}: {}'.format(game_number, '; '.join(draws))
+
+
+def game_lines(rng: random.Random, n_games: int | None = None, **options) -> Iterator[str]:
+    game_number = 1
+    while n_games is None or game_number <= n_games:
+        yield game_line(rng, game_number, **options)
+        game_number += 1
+
+
+def schematic_row(rng: random.Random, width: int, number_density: float = 0.06,
+                  symbol_density: float = 0.04, gear_share: float = 0.5) -> str:
+    # Densities are per cell; gear_share is the fraction of symbols that are '*'.
+    row = []
+    length = 0
+    while length < width:
+        kind = rng.random()
+        if kind < number_density:
+            number = str(rng.randint(1, 999))
+            row.append(number + '.')
+            length += len(number) + 1
+            continue
+        length += 1
+        if kind < number_density + symbol_density:
+            row.append('*' if rng.random() < gear_share else rng.choice(symbols[1:]))
+        else:
+            row.append('.')
+    return ''.join(row)[:width]
+
+
+def schematic_rows(rng: random.Random, height: int | None = None, width: int = 140,
+                   **options) -> Iterator[str]:
+    i = 0
+    while height is None or i < height:
+        yield schematic_row(rng, width, **options)
+        i += 1
+
+
+def write_lines(path: str, lines: Iterable[str], max_bytes: int | None = None) -> int:
+    # Lines are written in fixed-size batches, so memory does not depend on
+    # the output size. Like the shipped inputs, the file does not end with a
+    # newline. With max_bytes the (possibly endless) stream is cut at the
+    # first line that reaches the limit.
+    written = 0
+    batch = []
+    separator = ''
+    with open(path, 'w', buffering=1 << 20) as f:
+        for line in lines:
+            batch.append(line)
+            written += len(line) + 1
+            full = max_bytes is not None and written >= max_bytes
+            if len(batch) == batch_lines or full:
+                f.write(separator + '\n'.join(batch))
+                separator = '\n'
+                batch = []
+                if full:
+                    break
+        if batch:
+            f.write(separator + '\n'.join(batch))
+    return max(written - 1, 0)
+
+
+def input_lines(day: int, rng: random.Random, size: int | None, **options) -> Iterator[str]:
+    if day == 1:
+        return calibration_lines(rng, size, **options)
+    if day == 2:
+        return game_lines(rng, size, **options)
+    if day == 3:
+        return schematic_rows(rng, size, **options)
+    raise KeyError("`day` should be one of {}".format(sorted(shipped_sizes)))
+
+
+def generate_input(day: int, path: str, scale: int = 1, seed: int = 0, max_bytes: int | None = None,
+                   **options) -> int:
+    rng = random.Random(seed)
+    size = None if max_bytes is not None else shipped_sizes[day] * scale
+    return write_lines(path, input_lines(day, rng, size, **options), max_bytes=max_bytes)
+
+
+def parse_size(text: str) -> int:
+    unit = text[-1].lower()
+    if unit in size_units:
+        return int(float(text[:-1]) * size_units[unit])
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic puzzle input to disk.")
+    parser.add_argument('day', type=int, choices=sorted(shipped_sizes))
+    parser.add_argument('path')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--scale', type=int, default=1, help="multiple of the shipped input length")
+    size.add_argument('--size', type=parse_size, default=None, help="target size in bytes, e.g. 500M or 10G")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--overlap-share', type=float, help="day 1: share of overlapping spelled digits")
+    parser.add_argument('--word-share', type=float, help="day 1: share of spelled digits")
+    parser.add_argument('--min-draws', type=int, help="day 2: fewest draws per game")
+    parser.add_argument('--max-draws', type=int, help="day 2: most draws per game")
+    parser.add_argument('--max-count', type=int, help="day 2: largest cube count in a draw")
+    parser.add_argument('--width', type=int, help="day 3: schematic width")
+    parser.add_argument('--number-density', type=float, help="day 3: numbers per cell")
+    parser.add_argument('--symbol-density', type=float, help="day 3: symbols per cell")
+    parser.add_argument('--gear-share', type=float, help="day 3: share of symbols that are '*'")
+    args = parser.parse_args(argv)
+
+    day_options = {
+        1: ['overlap_share', 'word_share'],
+        2: ['min_draws', 'max_draws', 'max_count'],
+        3: ['width', 'number_density', 'symbol_density', 'gear_share'],
+    }
+    options = {k: getattr(args, k) for k in day_options[args.day] if getattr(args, k) is not None}
+    written = generate_input(args.day, args.path, scale=args.scale, seed=args.seed, max_bytes=args.size,
+                             **options)
+    print("Wrote {} bytes to {}".format(written, args.path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import argparse
+
+from common import instrumentation
+from tools.solvers import default_input, solver_module
+
+
+def parse_and_solve(module, data: bytes) -> int:
+    return module.solve(module.parse(data))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report stage timings, counters and memory for one solver.")
+    parser.add_argument('day', type=int)
+    parser.add_argument('part', type=int)
+    parser.add_argument('--input', default=None, help="input file, the day's input_1.txt if omitted")
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc peaks")
+    parser.add_argument('--profile', action='store_true', help="also run under cProfile and print the stats")
+    parser.add_argument('--dump', default=None, help="write the cProfile stats to this file")
+    parser.add_argument('--sort', default='cumulative')
+    parser.add_argument('--limit', type=int, default=25)
+    args = parser.parse_args(argv)
+
+    module = solver_module(args.day, args.part)
+    path = args.input if args.input is not None else default_input(args.day)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    instrumentation.enable(trace_memory=not args.no_memory)
+    if args.profile or args.dump is not None:
+        answer = instrumentation.profile(parse_and_solve, module, data, output=args.dump,
+                                         sort=args.sort, limit=args.limit)
+    else:
+        answer = parse_and_solve(module, data)
+    print(instrumentation.disable().report())
+    print("Answer: {}".format(answer))
+
+
+if __name__ == '__main__':
+    main()
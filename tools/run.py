@@ -0,0 +1,105 @@
+import argparse
+import importlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from tools.cache import ResultCache, default_directory, default_max_entries, input_digest
+from tools.solvers import default_input, discover_solvers
+
+
+def run_solver(module_name: str, data: bytes) -> tuple[int, float]:
+    module = importlib.import_module(module_name)
+    start = time.perf_counter()
+    answer = module.solve(module.parse(data))
+    return answer, time.perf_counter() - start
+
+
+def parse_inputs(values: list[str]) -> dict[int, Path]:
+    inputs = {}
+    for value in values:
+        day, _, path = value.partition('=')
+        if not path:
+            raise argparse.ArgumentTypeError("inputs are given as DAY=PATH, got {!r}".format(value))
+        inputs[int(day)] = Path(path)
+    return inputs
+
+
+def run(selected: list[tuple[int, int]], inputs: dict[int, Path], workers: int | None = None,
+        cache: ResultCache | None = None) -> list[dict]:
+    solvers = discover_solvers()
+    # Each input file is read and hashed once, whatever the number of parts using it.
+    contents, digests = {}, {}
+    for day, _ in selected:
+        path = inputs.get(day, default_input(day))
+        if path not in contents:
+            contents[path] = path.read_bytes()
+            if cache is not None:
+                digests[path] = input_digest(contents[path])
+
+    results = []
+    pending = []
+    for day, part in selected:
+        path = inputs.get(day, default_input(day))
+        result = {'day': day, 'part': part, 'input': str(path), 'cached': False}
+        results.append(result)
+        if cache is not None:
+            start = time.perf_counter()
+            result['key'] = cache.key(day, part, digests[path])
+            answer = cache.get(result['key'])
+            if answer is not None:
+                result.update(answer=answer, seconds=time.perf_counter() - start, cached=True)
+                continue
+        pending.append(result)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_solver, solvers[(r['day'], r['part'])], contents[Path(r['input'])])
+                       for r in pending]
+            for result, future in zip(pending, futures):
+                result['answer'], result['seconds'] = future.result()
+                if cache is not None:
+                    cache.put(result['key'], result['answer'], day=result['day'], part=result['part'])
+    for result in results:
+        result.pop('key', None)
+    return results
+
+
+def main(argv=None):
+    solvers = discover_solvers()
+    parser = argparse.ArgumentParser(description="Solve several days and parts in one process pool.")
+    parser.add_argument('--input', dest='inputs', action='append', default=[], metavar='DAY=PATH',
+                        help="input file for a day, the day's input_1.txt if omitted")
+    parser.add_argument('--days', type=int, nargs='+', default=sorted({d for d, _ in solvers}))
+    parser.add_argument('--parts', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help="print the results as JSON")
+    parser.add_argument('--no-cache', action='store_true', help="neither read nor write cached results")
+    parser.add_argument('--clear-cache', action='store_true', help="drop every cached result first")
+    parser.add_argument('--cache-dir', type=Path, default=default_directory)
+    parser.add_argument('--cache-size', type=int, default=default_max_entries,
+                        help="cached results kept, least recently used are evicted")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.cache_dir, max_entries=args.cache_size)
+    if args.clear_cache:
+        cache.clear()
+
+    selected = [(d, p) for d, p in solvers if d in args.days and p in args.parts]
+    start = time.perf_counter()
+    results = run(selected, parse_inputs(args.inputs), workers=args.workers,
+                  cache=None if args.no_cache else cache)
+    wall = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({'wall_seconds': wall, 'results': results}, indent=2))
+        return
+    for r in results:
+        print('Day {} part {}: {:>12}  ({:.4f} s{})'.format(r['day'], r['part'], r['answer'], r['seconds'],
+                                                           ', cached' if r['cached'] else ''))
+    print('Total wall time: {:.4f} s'.format(wall))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+import importlib
+import re
+from pathlib import Path
+
+root = Path(__file__).resolve().parent.parent
+module_pattern = re.compile(r'day_(\d+)/event_(\d+)\.py$')
+
+
+def discover_solvers() -> dict[tuple[int, int], str]:
+    # (day, part) -> module name, for every day_N/event_M.py in the repository.
+    solvers = {}
+    for path in root.glob('day_*/event_*.py'):
+        match = module_pattern.search(path.relative_to(root).as_posix())
+        if match:
+            day, part = int(match.group(1)), int(match.group(2))
+            solvers[(day, part)] = 'day_{}.event_{}'.format(day, part)
+    return dict(sorted(solvers.items()))
+
+
+def solver_module(day: int, part: int):
+    return importlib.import_module('day_{}.event_{}'.format(day, part))
+
+
+def default_input(day: int) -> Path:
+    return root / 'day_{}'.format(day) / 'input_1.txt'